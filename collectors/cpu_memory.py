@@ -1,11 +1,95 @@
-
 import psutil
+from dataclasses import dataclass
+from collectors.proc_reader import ProcReader, HAS_PROC
+
+# Single pread of /proc/meminfo covers every field we report, so the Linux
+# fast path avoids the extra parsing psutil does for fields we never use.
+MEMINFO_PATH = '/proc/meminfo'
+PERCENT_PRECISION = 1
+BYTES_PER_KILOBYTE = 1024
+
+STAT_PATH = '/proc/stat'
+# user nice system idle iowait irq softirq steal
+CPU_TIME_FIELDS = 8
+IDLE_FIELD = 3
+IOWAIT_FIELD = 4
+
+_meminfo_reader = ProcReader(MEMINFO_PATH)
+_stat_reader = ProcReader(STAT_PATH)
+_last_cpu_times = None
+
+@dataclass(slots=True, frozen=True)
+class MemorySample:
+    """One memory reading, all sizes in bytes"""
+    total: int
+    available: int
+    used: int
+    percent: float
+
+def _parse_meminfo(raw):
+    """Parse raw /proc/meminfo bytes into a field -> kilobytes dict"""
+    fields = {}
+    for line in raw.split(b'\n'):
+        if b':' not in line:
+            continue
+        name, _, value = line.partition(b':')
+        fields[name] = int(value.split()[0])
+    return fields
+
+def _collect_memory_data_linux():
+    """Read memory stats from /proc/meminfo with a single pread"""
+    fields = _parse_meminfo(_meminfo_reader.read())
+
+    total = fields[b'MemTotal'] * BYTES_PER_KILOBYTE
+    available = fields.get(b'MemAvailable', fields[b'MemFree']) * BYTES_PER_KILOBYTE
+
+    # Match psutil's definition (used = total - available) so the Linux
+    # fast path, the psutil fallback and the percent field all agree.
+    used = total - available
+    percent = round(used / total * 100, PERCENT_PRECISION)
+
+    return MemorySample(total=total, available=available, used=used, percent=percent)
+
+def _read_cpu_times():
+    """Return (total, idle) jiffies from the aggregate line of /proc/stat"""
+    first_line = _stat_reader.read().split(b'\n', 1)[0]
+    values = [int(field) for field in first_line.split()[1:1 + CPU_TIME_FIELDS]]
+    return sum(values), values[IDLE_FIELD] + values[IOWAIT_FIELD]
+
+def collect_cpu_percent():
+    """System-wide CPU usage from our own /proc/stat delta
+
+    Holding the previous reading locally avoids psutil.cpu_percent's
+    process-global delta state, which resets to 0 whenever any other code
+    in the process also calls it.
+    """
+    global _last_cpu_times
+    if HAS_PROC:
+        try:
+            total, idle = _read_cpu_times()
+        except (OSError, ValueError, IndexError):
+            return psutil.cpu_percent(interval=None)
+
+        previous = _last_cpu_times
+        _last_cpu_times = (total, idle)
+        if previous is None:
+            return 0.0
+
+        total_delta = total - previous[0]
+        if total_delta <= 0:
+            return 0.0
+        busy_delta = total_delta - (idle - previous[1])
+        return round(100.0 * busy_delta / total_delta, PERCENT_PRECISION)
+
+    return psutil.cpu_percent(interval=None)
 
 def collect_memory_data():
+    if HAS_PROC:
+        try:
+            return _collect_memory_data_linux()
+        except (OSError, KeyError, ValueError):
+            pass
+
     memory = psutil.virtual_memory()
-    return {
-        'memory_total': memory.total,
-        'memory_available': memory.available,
-        'memory_used': memory.used,
-        'memory_percent': memory.percent
-    }
+    return MemorySample(total=memory.total, available=memory.available,
+                        used=memory.used, percent=memory.percent)
@@ -2,96 +2,271 @@
 import psutil
 import os
 import time
+from dataclasses import dataclass
+from collectors.proc_reader import ProcReader, HAS_PROC
+
+# Partitions and usage change slowly, so they are refreshed on a TTL while
+# I/O counters (a single /proc/diskstats read) stay on every tick.
+DEFAULT_PARTITIONS_TTL = 30.0
+DEFAULT_USAGE_TTL = 2.0
+DEFAULT_MIN_INTERVAL = 0.1
+
+DISKSTATS_PATH = '/proc/diskstats'
+SYS_BLOCK_CLASS = '/sys/class/block'
+
+# Pseudo filesystems that slip past disk_partitions(all=False) on some
+# systems; they only waste statvfs calls and clutter the output with
+# duplicates of the device underneath. A denylist keeps unknown-but-real
+# filesystems (fuseblk NTFS mounts, jfs, removable udf media, ...) monitored.
+PSEUDO_FSTYPES = frozenset((
+    'overlay', 'overlayfs', 'squashfs', 'tmpfs', 'devtmpfs', 'ramfs',
+    'autofs', 'proc', 'sysfs', 'devpts', 'cgroup', 'cgroup2', 'debugfs',
+    'tracefs', 'securityfs', 'pstore', 'bpf', 'configfs', 'fusectl',
+    'hugetlbfs', 'mqueue', 'binfmt_misc', 'rpc_pipefs', 'nsfs',
+))
+
+# Windows storage IOCTL constants for volume -> physical drive resolution
+IOCTL_STORAGE_GET_DEVICE_NUMBER = 0x2D1080
+GENERIC_READ_FLAG = 0
+FILE_SHARE_READ_WRITE = 0x3
+OPEN_EXISTING = 3
+INVALID_HANDLE_VALUE = -1
+
+def _query_device_number(volume_device):
+    """Return the physical drive number behind a Windows volume, or None"""
+    if os.name != 'nt':
+        return None
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        volume_path = '\\\\.\\' + volume_device.rstrip('\\')
+        handle = kernel32.CreateFileW(volume_path, GENERIC_READ_FLAG,
+                                      FILE_SHARE_READ_WRITE, None,
+                                      OPEN_EXISTING, 0, None)
+        if handle == INVALID_HANDLE_VALUE:
+            return None
+        try:
+            # STORAGE_DEVICE_NUMBER: DeviceType, DeviceNumber, PartitionNumber
+            device_number = (ctypes.c_uint32 * 3)()
+            returned = ctypes.c_uint32()
+            ok = kernel32.DeviceIoControl(
+                handle, IOCTL_STORAGE_GET_DEVICE_NUMBER, None, 0,
+                ctypes.byref(device_number), ctypes.sizeof(device_number),
+                ctypes.byref(returned), None
+            )
+            return device_number[1] if ok else None
+        finally:
+            kernel32.CloseHandle(handle)
+    except Exception:
+        return None
+# The kernel reports /proc/diskstats sectors in fixed 512-byte units
+SECTOR_SIZE = 512
+DEVICE_NAME_FIELD = 2
+SECTORS_READ_FIELD = 5
+SECTORS_WRITTEN_FIELD = 9
+
+_diskstats_reader = ProcReader(DISKSTATS_PATH)
+
+@dataclass(slots=True, frozen=True)
+class DiskIoCounters:
+    """Byte counters for one block device, attribute-compatible with psutil"""
+    read_bytes: int
+    write_bytes: int
+
+def _read_disk_io_linux():
+    """Parse per-device byte counters from a single pread of /proc/diskstats"""
+    counters = {}
+    for line in _diskstats_reader.read().split(b'\n'):
+        fields = line.split()
+        if len(fields) <= SECTORS_WRITTEN_FIELD:
+            continue
+        counters[fields[DEVICE_NAME_FIELD].decode()] = DiskIoCounters(
+            read_bytes=int(fields[SECTORS_READ_FIELD]) * SECTOR_SIZE,
+            write_bytes=int(fields[SECTORS_WRITTEN_FIELD]) * SECTOR_SIZE
+        )
+    return counters
+
+def _read_disk_io():
+    if HAS_PROC:
+        try:
+            return _read_disk_io_linux()
+        except (OSError, ValueError):
+            pass
+    return psutil.disk_io_counters(perdisk=True, nowrap=True)
+
+@dataclass(slots=True)
+class IoCounterState:
+    """Last observed I/O counters and when they were read"""
+    io: object
+    time: float
+
+@dataclass(slots=True, frozen=True)
+class DiskSample:
+    """One disk reading; sizes in bytes, speeds in bytes per second"""
+    total: int
+    used: int
+    free: int
+    percent: float
+    mountpoint: str
+    fstype: str
+    read_speed: float
+    write_speed: float
 
 class DiskCollector:
-    def __init__(self):
+    def __init__(self, partitions_ttl=DEFAULT_PARTITIONS_TTL, usage_ttl=DEFAULT_USAGE_TTL,
+                 min_interval=DEFAULT_MIN_INTERVAL):
         self.last_disk_io = {}
         self.disk_map = {}
+        self.partitions_ttl = partitions_ttl
+        self.usage_ttl = usage_ttl
+        self.min_interval = min_interval
+        self._last_result = None
+        self._last_call_mono = float('-inf')
+        self._partitions_cache = []
+        self._partitions_ts = float('-inf')
+        self._usage_cache = {}
         self._initialize_disk_mapping()
 
     def _initialize_disk_mapping(self):
-        disk_io = psutil.disk_io_counters(perdisk=True)
-        for partition in psutil.disk_partitions(all=False):
+        disk_io = _read_disk_io()
+        # Scan the counter names once instead of per partition; sorting keeps
+        # the mapping deterministic when several physical drives exist.
+        self._physical_drives = sorted(
+            name for name in disk_io if name.startswith('PhysicalDrive')
+        )
+        for partition in self._physical_partitions():
             try:
                 self._map_partition(partition, disk_io)
             except Exception as e:
                 print(f"Error mapping disk {partition.device}: {e}")
 
+    @staticmethod
+    def _physical_partitions():
+        """Enumerate partitions, dropping known pseudo filesystems"""
+        return [partition for partition in psutil.disk_partitions(all=False)
+                if partition.fstype.lower() not in PSEUDO_FSTYPES]
+
     def collect_data(self):
+        now = time.monotonic()
+        if now - self._last_call_mono < self.min_interval:
+            return self._last_result
+        self._last_call_mono = now
+
         disk_data = {}
-        current_disk_io = psutil.disk_io_counters(perdisk=True)
+        current_disk_io = _read_disk_io()
         current_time = time.time()
 
-        for disk in psutil.disk_partitions(all=False):
+        for disk in self._get_partitions():
             disk_data[disk.device] = self._process_disk_metrics(disk, current_disk_io, current_time)
 
+        self._last_result = disk_data
         return disk_data
 
+    def refresh_static(self):
+        """Drop the cached partition list and usage so the next tick re-reads them
+
+        Lets callers force a re-enumeration (e.g. after mounting a drive)
+        without waiting out the TTLs.
+        """
+        self._partitions_ts = float('-inf')
+        self._usage_cache.clear()
+
+    def _get_partitions(self):
+        """Return partitions, re-enumerating only after the TTL expires"""
+        now = time.monotonic()
+        if now - self._partitions_ts > self.partitions_ttl:
+            self._partitions_cache = self._physical_partitions()
+            self._partitions_ts = now
+        return self._partitions_cache
+
+    def _get_disk_usage(self, mountpoint):
+        """Return disk usage, refreshing the statvfs call only after the TTL expires"""
+        now = time.monotonic()
+        cached = self._usage_cache.get(mountpoint)
+        if cached is None or now - cached['time'] > self.usage_ttl:
+            cached = {'usage': psutil.disk_usage(mountpoint), 'time': now}
+            self._usage_cache[mountpoint] = cached
+        return cached['usage']
+
     def _map_partition(self, partition, disk_io):
         if os.name == 'nt':  # Windows
-            for io_name in disk_io.keys():
-                if io_name.startswith('PhysicalDrive'):
-                    self.disk_map[partition.device] = io_name
-                    self.last_disk_io[partition.device] = {
-                        'io': disk_io[io_name],
-                        'time': time.time()
-                    }
-                    break
+            io_name = self._resolve_physical_drive(partition)
         else:  # Linux/Unix
-            base_device = partition.device.rstrip('0123456789')
-            device_name = base_device.split('/')[-1]
-            if device_name in disk_io:
-                self.disk_map[partition.device] = device_name
-                self.last_disk_io[partition.device] = {
-                    'io': disk_io[device_name],
-                    'time': time.time()
-                }
+            io_name = self._resolve_base_device(partition.device)
+
+        if io_name is not None and io_name in disk_io:
+            self.disk_map[partition.device] = io_name
+            self.last_disk_io[partition.device] = IoCounterState(
+                io=disk_io[io_name], time=time.time()
+            )
+
+    def _resolve_physical_drive(self, partition):
+        """Map a Windows volume to its PhysicalDrive via the storage IOCTL"""
+        device_number = _query_device_number(partition.device)
+        if device_number is not None:
+            return f'PhysicalDrive{device_number}'
+        # Could not query the volume; fall back to the first known drive
+        return self._physical_drives[0] if self._physical_drives else None
+
+    @staticmethod
+    def _resolve_base_device(partition_device):
+        """Resolve a partition to its parent block device through sysfs
+
+        The sysfs parent handles names like nvme0n1p1 that the old
+        strip-trailing-digits heuristic got wrong; the heuristic remains
+        as the fallback when sysfs is unavailable.
+        """
+        name = partition_device.split('/')[-1]
+        sys_path = f'{SYS_BLOCK_CLASS}/{name}'
+        if os.path.exists(sys_path):
+            parent = os.path.basename(os.path.dirname(os.path.realpath(sys_path)))
+            return name if parent == 'block' else parent
+        return partition_device.rstrip('0123456789').split('/')[-1]
 
     def _process_disk_metrics(self, disk, current_disk_io, current_time):
         try:
-            usage = psutil.disk_usage(disk.mountpoint)
-            disk_info = {
-                'total': usage.total,
-                'used': usage.used,
-                'free': usage.free,
-                'percent': usage.percent,
-                'mountpoint': disk.mountpoint,
-                'fstype': disk.fstype,
-                'read_speed': 0,
-                'write_speed': 0
-            }
+            usage = self._get_disk_usage(disk.mountpoint)
 
+            speeds = {'read_speed': 0, 'write_speed': 0}
             if disk.device in self.disk_map:
-                disk_info.update(
-                    self._calculate_disk_io_speeds(
-                        disk.device,
-                        current_disk_io,
-                        current_time
-                    )
+                speeds = self._calculate_disk_io_speeds(
+                    disk.device, current_disk_io, current_time
                 )
 
-            return disk_info
+            return DiskSample(
+                total=usage.total,
+                used=usage.used,
+                free=usage.free,
+                percent=usage.percent,
+                mountpoint=disk.mountpoint,
+                fstype=disk.fstype,
+                read_speed=speeds['read_speed'],
+                write_speed=speeds['write_speed']
+            )
         except Exception as e:
             print(f"Error processing disk {disk.device}: {str(e)}")
             return None
 
     def _calculate_disk_io_speeds(self, device, current_disk_io, current_time):
         io_name = self.disk_map[device]
-        if io_name not in current_disk_io or device not in self.last_disk_io:
+        last_state = self.last_disk_io.get(device)
+        if io_name not in current_disk_io or last_state is None:
             return {'read_speed': 0, 'write_speed': 0}
 
         current_io = current_disk_io[io_name]
-        last_io = self.last_disk_io[device]['io']
-        io_time_diff = current_time - self.last_disk_io[device]['time']
+        io_time_diff = current_time - last_state.time
 
         if io_time_diff <= 0:
             return {'read_speed': 0, 'write_speed': 0}
 
-        read_speed = max(0, (current_io.read_bytes - last_io.read_bytes) / io_time_diff)
-        write_speed = max(0, (current_io.write_bytes - last_io.write_bytes) / io_time_diff)
+        read_bytes = current_io.read_bytes
+        write_bytes = current_io.write_bytes
+        last_io = last_state.io
+        read_speed = max(0, (read_bytes - last_io.read_bytes) / io_time_diff)
+        write_speed = max(0, (write_bytes - last_io.write_bytes) / io_time_diff)
 
-        self.last_disk_io[device]['io'] = current_io
-        self.last_disk_io[device]['time'] = current_time
+        last_state.io = current_io
+        last_state.time = current_time
 
         return {
             'read_speed': read_speed,
@@ -1,35 +1,108 @@
+import atexit
+import time
+from dataclasses import dataclass
 
-import GPUtil
+DEFAULT_MIN_INTERVAL = 0.1
+BYTES_TO_MB = 1024 * 1024
+INV_BYTES_TO_MB = 1.0 / BYTES_TO_MB
+
+# NVML costs a library load plus a driver handshake; importing it lazily
+# keeps that off the startup path and off GPU-less machines entirely.
+pynvml = None
+
+def _load_nvml():
+    global pynvml
+    if pynvml is None:
+        import pynvml as nvml_module
+        pynvml = nvml_module
+    return pynvml
+
+@dataclass(slots=True, frozen=True)
+class GPUSample:
+    """One GPU reading; memory sizes in MB, load and utilization in percent"""
+    index: int
+    name: str
+    load: float
+    memory_total: float
+    memory_used: float
+    memory_free: float
+    memory_util: float
+    temperature: float
 
 class GPUCollector:
-    def __init__(self):
-        self.has_gpu = True
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL):
+        # None means the NVML probe has not run yet; it happens on the first
+        # collection tick so construction stays instant.
+        self.has_gpu = None
+        self.min_interval = min_interval
+        self._last_result = None
+        self._last_call_mono = float('-inf')
+        self._handles = []
+        self._names = []
+
+    def _probe(self):
+        """Initialize NVML and cache per-device handles, names and totals"""
+        self.has_gpu = False
         try:
-            GPUtil.getGPUs()
-        except:
-            self.has_gpu = False
+            pynvml = _load_nvml()
+            pynvml.nvmlInit()
+            atexit.register(pynvml.nvmlShutdown)
+            device_count = pynvml.nvmlDeviceGetCount()
+            self._handles = [pynvml.nvmlDeviceGetHandleByIndex(i) for i in range(device_count)]
+            self._names = [self._get_device_name(handle) for handle in self._handles]
+            # Total memory never changes, so probe it once alongside the names
+            self._memory_totals = [
+                pynvml.nvmlDeviceGetMemoryInfo(handle).total * INV_BYTES_TO_MB
+                for handle in self._handles
+            ]
+            self.has_gpu = device_count > 0
+        except Exception:
+            pass
+
+        if not self.has_gpu:
             print("No GPU detected - GPU monitoring disabled")
 
+    @staticmethod
+    def _get_device_name(handle):
+        name = pynvml.nvmlDeviceGetName(handle)
+        return name.decode() if isinstance(name, bytes) else name
+
     def collect_data(self):
+        if self.has_gpu is None:
+            self._probe()
         if not self.has_gpu:
             return None
 
+        now = time.monotonic()
+        if now - self._last_call_mono < self.min_interval:
+            return self._last_result
+        self._last_call_mono = now
+
         try:
-            gpus = GPUtil.getGPUs()
-            if not gpus:
-                self.has_gpu = False
-                return None
-
-            return [{
-                'index': gpu.id,
-                'name': gpu.name,
-                'load': gpu.load * 100,
-                'memory_total': gpu.memoryTotal,
-                'memory_used': gpu.memoryUsed,
-                'memory_free': gpu.memoryFree,
-                'memory_util': gpu.memoryUtil * 100,
-                'temperature': gpu.temperature
-            } for gpu in gpus]
-        except:
+            self._last_result = [
+                self._collect_device_data(index, handle)
+                for index, handle in enumerate(self._handles)
+            ]
+            return self._last_result
+        except Exception:
             self.has_gpu = False
             return None
+
+    def _collect_device_data(self, index, handle):
+        """Query utilization, memory and temperature through cached NVML handles"""
+        utilization = pynvml.nvmlDeviceGetUtilizationRates(handle)
+        memory = pynvml.nvmlDeviceGetMemoryInfo(handle)
+        temperature = pynvml.nvmlDeviceGetTemperature(handle, pynvml.NVML_TEMPERATURE_GPU)
+
+        memory_total = self._memory_totals[index]
+        memory_used = memory.used * INV_BYTES_TO_MB
+        return GPUSample(
+            index=index,
+            name=self._names[index],
+            load=utilization.gpu,
+            memory_total=memory_total,
+            memory_used=memory_used,
+            memory_free=memory.free * INV_BYTES_TO_MB,
+            memory_util=memory_used / memory_total * 100 if memory_total else 0,
+            temperature=temperature
+        )
@@ -1,17 +1,87 @@
 import psutil
 import time
+from dataclasses import dataclass
+from collectors.proc_reader import ProcReader, HAS_PROC
+
+NET_DEV_PATH = '/proc/net/dev'
+NET_DEV_HEADER_LINES = 2
+RECV_BYTES_FIELD = 0
+RECV_PACKETS_FIELD = 1
+SENT_BYTES_FIELD = 8
+SENT_PACKETS_FIELD = 9
+DEFAULT_MIN_INTERVAL = 0.1
+
+_net_dev_reader = ProcReader(NET_DEV_PATH)
+
+@dataclass(slots=True, frozen=True)
+class IoTotals:
+    """Aggregate interface counters, attribute-compatible with psutil's snetio"""
+    bytes_sent: int
+    bytes_recv: int
+    packets_sent: int
+    packets_recv: int
+
+def _read_net_io_linux():
+    """Sum interface counters from a single pread of /proc/net/dev"""
+    lines = _net_dev_reader.read().split(b'\n')[NET_DEV_HEADER_LINES:]
+
+    bytes_sent = bytes_recv = packets_sent = packets_recv = 0
+    for line in lines:
+        _, separator, counters = line.partition(b':')
+        if not separator:
+            continue
+        fields = counters.split()
+        bytes_recv += int(fields[RECV_BYTES_FIELD])
+        packets_recv += int(fields[RECV_PACKETS_FIELD])
+        bytes_sent += int(fields[SENT_BYTES_FIELD])
+        packets_sent += int(fields[SENT_PACKETS_FIELD])
+
+    return IoTotals(bytes_sent=bytes_sent, bytes_recv=bytes_recv,
+                    packets_sent=packets_sent, packets_recv=packets_recv)
+
+def _read_net_io():
+    if HAS_PROC:
+        try:
+            return _read_net_io_linux()
+        except (OSError, IndexError, ValueError):
+            pass
+    return psutil.net_io_counters(nowrap=True)
+
+@dataclass(slots=True, frozen=True)
+class NetworkSample:
+    """One network reading as deltas since the previous tick
+
+    Deltas stay small and bounded instead of repeating ever-growing
+    counter totals; absolute totals are recoverable from the collector's
+    session baseline plus the sum of deltas.
+    """
+    bytes_sent_delta: int
+    bytes_recv_delta: int
+    packets_sent_delta: int
+    packets_recv_delta: int
+    send_speed: float
+    recv_speed: float
 
 class NetworkCollector:
-    def __init__(self):
-        current_io = psutil.net_io_counters()
+    def __init__(self, min_interval=DEFAULT_MIN_INTERVAL):
+        current_io = _read_net_io()
+        self.baseline = current_io  # Session-start totals for rehydrating deltas
         self.last_net_io = {
             'io': current_io,
             'time': time.time()
         }
+        self.min_interval = min_interval
+        self._last_result = None
+        self._last_call_mono = float('-inf')
 
     def collect_data(self):
         """Collect current network I/O metrics"""
-        current_io = psutil.net_io_counters()
+        now = time.monotonic()
+        if now - self._last_call_mono < self.min_interval:
+            return self._last_result
+        self._last_call_mono = now
+
+        current_io = _read_net_io()
         current_time = time.time()
         time_diff = current_time - self.last_net_io['time']
         last_io = self.last_net_io['io']
@@ -24,18 +94,19 @@ class NetworkCollector:
             'time': current_time
         }
 
+        self._last_result = network_stats
         return network_stats
 
     def _calculate_network_speeds(self, current_io, last_io, time_diff):
-        """Calculate network speeds based on I/O differences"""
-        bytes_sent_sec = (current_io.bytes_sent - last_io.bytes_sent) / time_diff if time_diff > 0 else 0
-        bytes_recv_sec = (current_io.bytes_recv - last_io.bytes_recv) / time_diff if time_diff > 0 else 0
-
-        return {
-            'bytes_sent': current_io.bytes_sent,
-            'bytes_recv': current_io.bytes_recv,
-            'packets_sent': current_io.packets_sent,
-            'packets_recv': current_io.packets_recv,
-            'send_speed': bytes_sent_sec,
-            'recv_speed': bytes_recv_sec
-        }
+        """Calculate per-tick deltas and speeds from the counter differences"""
+        bytes_sent_delta = current_io.bytes_sent - last_io.bytes_sent
+        bytes_recv_delta = current_io.bytes_recv - last_io.bytes_recv
+
+        return NetworkSample(
+            bytes_sent_delta=bytes_sent_delta,
+            bytes_recv_delta=bytes_recv_delta,
+            packets_sent_delta=current_io.packets_sent - last_io.packets_sent,
+            packets_recv_delta=current_io.packets_recv - last_io.packets_recv,
+            send_speed=bytes_sent_delta / time_diff if time_diff > 0 else 0,
+            recv_speed=bytes_recv_delta / time_diff if time_diff > 0 else 0
+        )
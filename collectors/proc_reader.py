@@ -0,0 +1,43 @@
+import os
+
+PROC_DIRECTORY = '/proc'
+READ_SIZE = 65536
+
+HAS_PROC = os.name == 'posix' and os.path.isdir(PROC_DIRECTORY)
+
+class ProcReader:
+    """Read one /proc file repeatedly through a single cached descriptor
+
+    Opening the file once and issuing a pread per tick skips the
+    open/close syscall pair and path resolution that a plain open() in the
+    hot loop would pay.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._fd = None
+
+    def read(self):
+        """Return the current file contents as bytes
+
+        Reads continue at an advancing offset until a short read so files
+        larger than READ_SIZE (e.g. /proc/net/dev with hundreds of veth
+        interfaces) are never silently truncated mid-line.
+        """
+        if self._fd is None:
+            self._fd = os.open(self.path, os.O_RDONLY)
+        data = os.pread(self._fd, READ_SIZE, 0)
+        if len(data) < READ_SIZE:
+            return data
+        chunks = [data]
+        offset = len(data)
+        while len(data) == READ_SIZE:
+            data = os.pread(self._fd, READ_SIZE, offset)
+            chunks.append(data)
+            offset += len(data)
+        return b''.join(chunks)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
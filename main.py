@@ -22,7 +22,10 @@ def parse_arguments():
     parser.add_argument('-d', '--duration', type=float,
                       help='Total duration of monitoring in seconds')
     parser.add_argument('-o', '--output',
-                      help='Output file path to save monitoring data')
+                      help='Output file path to save monitoring data '
+                           '(a .gz suffix enables gzip compression)')
+    parser.add_argument('--durable', action='store_true',
+                      help='fsync the output file on each periodic flush')
 
     args = parser.parse_args()
 
@@ -37,7 +40,8 @@ def main():
     monitor = ResourceMonitor(
         interval=args.interval,
         duration=args.duration,
-        output_file=args.output
+        output_file=args.output,
+        durable=args.durable
     )
     monitor.start_monitoring()
 
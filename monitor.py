@@ -1,87 +1,113 @@
 import os
 import sys
 import time
-import psutil
-import msvcrt
 import csv
+import queue
+import signal
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from collectors.cpu_memory import collect_memory_data
+from collectors.cpu_memory import collect_cpu_percent, collect_memory_data
 from collectors.disk import DiskCollector
 from collectors.gpu import GPUCollector
 from collectors.network import NetworkCollector
 from utils.display import ScreenManager
-from utils.csv_export import DataExporter
+from utils.csv_export import CsvStreamWriter
+from utils.sample_history import SampleHistory
 from utils.formatters import *
 
+if os.name != 'nt':
+    import termios
+    import tty
+
 # Constants for formatting output
-OUTPUT_SEPARATOR = '\n'
 DISK_INDENT = '  '
 GPU_INDENT = '    '
 AUTO_SAVE_INTERVAL = 60
+COLLECTOR_THREADS = 4
+SNAPSHOT_QUEUE_SIZE = 128
+CONSUMER_POLL_INTERVAL = 0.1
+
+@dataclass(slots=True, frozen=True)
+class Snapshot:
+    """One tick's worth of readings, passed through display, CSV and history"""
+    timestamp: int
+    cpu_percent: float
+    memory: object
+    disks: dict
+    gpu_data: object
 
 class ResourceMonitor:
-    def __init__(self, interval=DEFAULT_INTERVAL, duration=None, output_file=None):
+    def __init__(self, interval=DEFAULT_INTERVAL, duration=None, output_file=None,
+                 durable=False):
         self.interval = interval
         self.duration = duration
         self.start_time = datetime.now()
         self.output_file = output_file or self._get_default_filename()
         self.monitoring = False
-        self.data = []
-        self.last_line_count = 0
-        self.should_stop = False
         self.last_save_time = time.time()
+        self._stop_event = threading.Event()
+        self._snapshot_queue = queue.Queue(maxsize=SNAPSHOT_QUEUE_SIZE)
+        self._write_queue = queue.Queue(maxsize=SNAPSHOT_QUEUE_SIZE)
 
         # Initialize collectors
         self.disk_collector = DiskCollector()
         self.gpu_collector = GPUCollector()
         self.network_collector = NetworkCollector()
         self.screen_manager = ScreenManager()
+        self._pool = ThreadPoolExecutor(max_workers=COLLECTOR_THREADS,
+                                        thread_name_prefix='collector')
+        self._csv_writer = CsvStreamWriter(self.output_file, durable=durable)
+        self.history = SampleHistory()
+        # Header lines only depend on identity fields that never change
+        # mid-run, so they are formatted once and reused every frame.
+        self._disk_headers = {}
+        self._gpu_headers = {}
+        # The CPU percentage is a delta against the previous reading and
+        # returns 0.0 on the very first call; priming it here keeps the
+        # first recorded sample meaningful.
+        collect_cpu_percent()
 
     def _get_default_filename(self):
         """Generate default filename using start time"""
         return f"resource_monitor_{self.start_time.strftime('%Y%m%d_%H%M%S')}.csv"
 
     def _collect_resource_data(self):
-        """Collect current snapshot of system resource usage"""
-        return {
-            'timestamp': datetime.now().isoformat(),
-            'cpu_percent': psutil.cpu_percent(interval=None),
-            **collect_memory_data(),
-            'disks': self.disk_collector.collect_data(),
-            'gpu_data': self.gpu_collector.collect_data()
-        }
-
-    def _clear_screen(self):
-        """Clear the terminal screen"""
-        if os.name == 'nt':  # Windows
-            os.system('cls')
-        else:  # Unix/Linux/MacOS
-            os.system('clear')
-
-    def _clear_last_output(self):
-        """Clear previous output lines"""
-        if os.name == 'nt':
-            self._clear_screen()
-        else:
-            # Move cursor up and clear lines
-            for _ in range(self.last_line_count):
-                sys.stdout.write('\033[F')  # Move cursor up
-                sys.stdout.write('\033[K')  # Clear line
+        """Collect current snapshot of system resource usage
+
+        The collectors block on kernel/NVML calls that release the GIL, so
+        dispatching them to the pool overlaps their wait time and the tick
+        costs max(collector_times) instead of the sum.
+        """
+        cpu_future = self._pool.submit(collect_cpu_percent)
+        memory_future = self._pool.submit(collect_memory_data)
+        disk_future = self._pool.submit(self.disk_collector.collect_data)
+        gpu_future = self._pool.submit(self.gpu_collector.collect_data)
+
+        return Snapshot(
+            timestamp=time.time_ns(),
+            cpu_percent=cpu_future.result(),
+            memory=memory_future.result(),
+            disks=disk_future.result(),
+            gpu_data=gpu_future.result()
+        )
 
     def _format_snapshot_lines(self, data):
         """Format resource data into displayable lines"""
+        memory = data.memory
         lines = [
-            f"Timestamp: {format_timestamp(data['timestamp'])}",
-            f"CPU Usage: {data['cpu_percent']:,}%",
-            f"Memory Used: {format_number(data['memory_used'] / BYTES_TO_GB)} GB ({data['memory_percent']:,}%)",
+            f"Timestamp: {format_timestamp(data.timestamp)}",
+            f"CPU Usage: {data.cpu_percent:,}%",
+            f"Memory Used: {format_number(memory.used * INV_BYTES_TO_GB)} GB ({memory.percent:,}%)",
             "",
             "Disk Usage:"
         ]
 
-        lines.extend(self._format_disk_lines(data['disks']))
+        lines.extend(self._format_disk_lines(data.disks))
 
-        if data['gpu_data']:
-            lines.extend(self._format_gpu_lines(data['gpu_data']))
+        if data.gpu_data:
+            lines.extend(self._format_gpu_lines(data.gpu_data))
 
         return lines
 
@@ -89,10 +115,14 @@ class ResourceMonitor:
         """Format disk metrics into lines"""
         lines = []
         for device, disk in disks.items():
+            header = self._disk_headers.get(device)
+            if header is None:
+                header = f"{device} ({disk.mountpoint}, {disk.fstype}):"
+                self._disk_headers[device] = header
             lines.extend([
-                f"{device} ({disk['mountpoint']}, {disk['fstype']}):",
-                f"{DISK_INDENT}Usage: {format_number(disk['used'] / BYTES_TO_GB)} GB / {format_number(disk['total'] / BYTES_TO_GB)} GB ({disk['percent']:,}%)",
-                f"{DISK_INDENT}I/O: Read: {format_speed(disk['read_speed'])}, Write: {format_speed(disk['write_speed'])}",
+                header,
+                f"{DISK_INDENT}Usage: {format_number(disk.used * INV_BYTES_TO_GB)} GB / {format_number(disk.total * INV_BYTES_TO_GB)} GB ({disk.percent:,}%)",
+                f"{DISK_INDENT}I/O: Read: {format_speed(disk.read_speed)}, Write: {format_speed(disk.write_speed)}",
                 ""
             ])
         return lines
@@ -101,97 +131,157 @@ class ResourceMonitor:
         """Format GPU metrics into lines"""
         lines = ["GPUs:"]
         for gpu in gpu_data:
+            header = self._gpu_headers.get(gpu.index)
+            if header is None:
+                header = f"{DISK_INDENT}GPU {gpu.index} ({gpu.name}):"
+                self._gpu_headers[gpu.index] = header
             lines.extend([
-                f"{DISK_INDENT}GPU {gpu['index']} ({gpu['name']}):",
-                f"{GPU_INDENT}Load: {int(gpu['load']):,}%",
-                f"{GPU_INDENT}Memory Used: {int(gpu['memory_used']):,} MB / {int(gpu['memory_total']):,} MB ({int(gpu['memory_util']):,}%)",
-                f"{GPU_INDENT}Temperature: {int(gpu['temperature']):,}°C"
+                header,
+                f"{GPU_INDENT}Load: {int(gpu.load):,}%",
+                f"{GPU_INDENT}Memory Used: {int(gpu.memory_used):,} MB / {int(gpu.memory_total):,} MB ({int(gpu.memory_util):,}%)",
+                f"{GPU_INDENT}Temperature: {int(gpu.temperature):,}°C"
             ])
         return lines
 
     def _print_current_snapshot(self, data):
         """Print current resource snapshot"""
-        self._clear_last_output()
-        lines = self._format_snapshot_lines(data)
-        print(OUTPUT_SEPARATOR.join(lines))
-        self.last_line_count = len(lines)
-
-    def _check_for_quit(self):
-        """Check for 'q' keypress without blocking"""
-        if os.name == 'nt':  # Windows
-            if msvcrt.kbhit():
-                key = msvcrt.getch().decode('utf-8').lower()
-                return key == 'q'
-        else:  # Unix-like
-            # Check if there's data to read from stdin
-            rlist, _, _ = select([sys.stdin], [], [], 0)
-            if rlist:
-                key = sys.stdin.read(1).lower()
-                return key == 'q'
-        return False
+        self.screen_manager.render_lines(self._format_snapshot_lines(data))
 
     def start_monitoring(self):
         """Start monitoring resources"""
         print("Starting resource monitoring. Press 'q' to stop, or Ctrl+C.")
         time.sleep(1)  # Give time to read the message
-        self._clear_screen()
+        self.screen_manager.clear_screen()
 
-        if os.name != 'nt':  # For Unix-like systems
+        if os.name != 'nt' and self.screen_manager.interactive:
             # Set up stdin for non-blocking reads
-            import termios, tty
             old_settings = termios.tcgetattr(sys.stdin)
             try:
                 tty.setcbreak(sys.stdin.fileno())
                 self._monitor_loop()
             finally:
                 termios.tcsetattr(sys.stdin, termios.TCSADRAIN, old_settings)
-        else:  # For Windows
+        else:  # Windows, or stdin is not a terminal (cron, pipelines)
             self._monitor_loop()
 
     def _monitor_loop(self):
-        """Main monitoring loop"""
+        """Run collection in a producer thread and consume snapshots here"""
         self.monitoring = True
-        start_time = time.time()
+        producer = threading.Thread(target=self._produce_snapshots,
+                                    name='producer', daemon=True)
+        producer.start()
+        writer = threading.Thread(target=self._write_snapshots,
+                                  name='csv-writer', daemon=True)
+        writer.start()
+        previous_handler = signal.signal(signal.SIGINT, self._handle_interrupt)
 
         try:
-            while self.monitoring:
-                resource_data = self._collect_resource_data()
-                self.data.append(resource_data)
+            self._consume_snapshots()
+        finally:
+            signal.signal(signal.SIGINT, previous_handler)
+            self._stop_event.set()
+            producer.join()
+            self._write_queue.put(None)  # sentinel: drain and exit
+            writer.join()
+            self.monitoring = False
+            self._finish_saving()
+
+    def _handle_interrupt(self, signum, frame):
+        """Turn Ctrl+C into a stop-event set so both threads wind down cleanly"""
+        print("\nMonitoring stopped by user (Ctrl+C).")
+        self._stop_event.set()
+
+    def _produce_snapshots(self):
+        """Collect snapshots on a drift-free monotonic schedule"""
+        next_tick = time.monotonic()
+        deadline = next_tick + self.duration if self.duration else None
+
+        while not self._stop_event.is_set():
+            resource_data = self._collect_resource_data()
+            try:
+                self._snapshot_queue.put(resource_data, timeout=self.interval)
+            except queue.Full:
+                pass  # Consumer stalled; drop the snapshot rather than block collection
+
+            next_tick += self.interval
+            now = time.monotonic()
+            if deadline and now >= deadline:
+                self._stop_event.set()
+                break
+
+            if next_tick <= now:
+                # Collection overran; stay on phase by skipping the missed
+                # ticks instead of sampling in a burst to catch up.
+                missed = int((now - next_tick) / self.interval) + 1
+                next_tick += missed * self.interval
+
+            delay = next_tick - now
+            if delay > 0 and self._stop_event.wait(delay):
+                break
+
+    def _consume_snapshots(self):
+        """Print and save snapshots, decoupled from collection timing"""
+        while not self._stop_event.is_set():
+            try:
+                resource_data = self._snapshot_queue.get(timeout=CONSUMER_POLL_INTERVAL)
+            except queue.Empty:
+                resource_data = None
+
+            if resource_data is not None:
                 self._print_current_snapshot(resource_data)
+                try:
+                    self._write_queue.put_nowait(resource_data)
+                except queue.Full:
+                    pass  # Writer stalled; drop the row rather than freeze the UI
+                memory = resource_data.memory
+                self.history.record(resource_data.timestamp,
+                                    resource_data.cpu_percent,
+                                    memory.used, memory.percent)
 
-                # Auto-save check
-                current_time = time.time()
-                if current_time - self.last_save_time >= AUTO_SAVE_INTERVAL:
-                    self._save_data()
-                    self.last_save_time = current_time
+            if self.screen_manager.check_for_quit():
+                print("\nMonitoring stopped by user ('q' pressed).")
+                self._stop_event.set()
 
-                if self._check_for_quit():
-                    print("\nMonitoring stopped by user ('q' pressed).")
-                    break
+    def _write_snapshots(self):
+        """Drain the write queue on a dedicated thread until the sentinel
 
-                if self.duration and (current_time - start_time) >= self.duration:
-                    break
+        Serialization and the (GIL-releasing) file writes happen here, so a
+        slow disk or a gzip flush never delays rendering or collection.
+        """
+        while True:
+            resource_data = self._write_queue.get()
+            if resource_data is None:
+                return
+            self._write_snapshot(resource_data)
 
-                time.sleep(self.interval)
+    def _write_snapshot(self, resource_data):
+        """Stream the snapshot to CSV, flushing periodically"""
+        try:
+            self._csv_writer.write_snapshot(resource_data)
+        except Exception as e:
+            print(f"\nError saving data: {e}")
+            return
 
-        except KeyboardInterrupt:
-            print("\nMonitoring stopped by user (Ctrl+C).")
-        finally:
-            self.monitoring = False
-            self._save_data()  # Final save when monitoring stops
+        current_time = time.time()
+        if current_time - self.last_save_time >= AUTO_SAVE_INTERVAL:
+            self._csv_writer.flush()
+            self.last_save_time = current_time
 
-    def _save_data(self):
-        """Save collected resource data"""
-        if not self.data:
+    def _finish_saving(self):
+        """Flush and close the CSV output when monitoring stops"""
+        if not self._csv_writer.rows_written:
             print("No data collected.")
             return
 
         try:
-            file_exists = os.path.exists(self.output_file)
-            DataExporter.save_to_csv(self.data, self.output_file)
-            if file_exists:
-                print(f"\nUpdated data in: {self.output_file}")
-            else:
-                print(f"\nCreated new file: {self.output_file}")
+            self._csv_writer.close()
+            print(f"\nSaved data to: {self.output_file}")
         except Exception as e:
             print(f"\nError saving data: {e}")
+
+        summary = self.history.summary()
+        if summary:
+            print(f"Session: {summary['samples']} samples, "
+                  f"CPU avg {format_number(summary['cpu_percent_avg'])}% "
+                  f"max {format_number(summary['cpu_percent_max'])}%, "
+                  f"memory max {format_number(summary['memory_percent_max'])}%")
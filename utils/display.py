@@ -1,34 +1,139 @@
 
 import os
+import selectors
 import sys
-from select import select
 if os.name == 'nt':
     import msvcrt
 
+ANSI_CURSOR_UP = '\033[F'
+ANSI_CLEAR_LINE = '\033[K'
+ANSI_CLEAR_SCREEN = '\033[2J\033[H'
+LINE_SEPARATOR = '\n'
+
+# Windows console constants for enabling ANSI escape processing
+STD_OUTPUT_HANDLE = -11
+ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+
 class ScreenManager:
     def __init__(self):
         self.last_line_count = 0
+        self._prev_lines = None
+        self.ansi_enabled = os.name != 'nt' or self._enable_windows_ansi()
+        # Non-interactive runs (cron, pipelines, redirected stdin) have no
+        # keyboard to poll, so the per-tick quit check can skip its syscall.
+        try:
+            self.interactive = sys.stdin.isatty()
+        except (ValueError, OSError):
+            self.interactive = False
+        # Register stdin once; re-creating fd sets per poll is what the old
+        # bare select() call paid for on every tick.
+        self._stdin_selector = None
+        if os.name != 'nt' and self.interactive:
+            try:
+                self._stdin_selector = selectors.DefaultSelector()
+                self._stdin_selector.register(sys.stdin, selectors.EVENT_READ)
+            except (ValueError, OSError):
+                self._stdin_selector = None
 
-    def clear_screen(self):
-        if os.name == 'nt':
-            os.system('cls')
+    @staticmethod
+    def _enable_windows_ansi():
+        """Turn on VT escape processing once so redraws avoid forking cls"""
+        try:
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            handle = kernel32.GetStdHandle(STD_OUTPUT_HANDLE)
+            mode = ctypes.c_uint32()
+            if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+                return False
+            return bool(kernel32.SetConsoleMode(
+                handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            ))
+        except Exception:
+            return False
+
+    def render_lines(self, lines):
+        """Redraw the frame with a single buffered stdout write
+
+        When the layout is stable only a handful of numeric lines change
+        per tick, so the steady state repaints just those lines; the full
+        clear-and-reprint path handles layout changes and the first frame.
+        """
+        if (self.ansi_enabled and self._prev_lines is not None
+                and len(lines) == len(self._prev_lines)):
+            self._render_diff(lines)
         else:
-            os.system('clear')
+            self._render_full(lines)
+        self._prev_lines = lines
+        self.last_line_count = len(lines)
 
-    def clear_last_output(self):
-        if os.name == 'nt':
+    @staticmethod
+    def _write_frame(text):
+        """Send one frame's worth of output as a single write
+
+        Going through sys.stdout.buffer with pre-encoded bytes skips the
+        TextIOWrapper lock and newline handling; the text path remains for
+        streams without a binary layer (e.g. captured stdout).
+        """
+        binary = getattr(sys.stdout, 'buffer', None)
+        if binary is not None:
+            binary.write(text.encode())
+            binary.flush()
+        else:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+    def _render_full(self, lines):
+        frame = LINE_SEPARATOR.join(lines) + LINE_SEPARATOR
+        if self.ansi_enabled:
+            frame = (ANSI_CURSOR_UP + ANSI_CLEAR_LINE) * self.last_line_count + frame
+        else:
             self.clear_screen()
+        self._write_frame(frame)
+
+    def _render_diff(self, lines):
+        """Repaint only the lines that differ from the previous frame
+
+        The cursor rests just below the frame between renders; each changed
+        line is reached with a relative cursor move, cleared and rewritten,
+        and the whole patch goes out as one write.
+        """
+        parts = []
+        cursor_row = len(lines)
+        for row, (old_line, new_line) in enumerate(zip(self._prev_lines, lines)):
+            if old_line == new_line:
+                continue
+            delta = cursor_row - row
+            if delta > 0:
+                parts.append(f'\033[{delta}F')
+            elif delta < 0:
+                parts.append(f'\033[{-delta}E')
+            parts.append(ANSI_CLEAR_LINE + new_line + LINE_SEPARATOR)
+            cursor_row = row + 1
+        if not parts:
+            return
+        if cursor_row < len(lines):
+            parts.append(f'\033[{len(lines) - cursor_row}E')
+        self._write_frame(''.join(parts))
+
+    def clear_screen(self):
+        """Clear via an escape sequence; forking cls/clear is the last resort"""
+        if self.ansi_enabled:
+            self._write_frame(ANSI_CLEAR_SCREEN)
+        elif os.name == 'nt':
+            os.system('cls')
         else:
-            for _ in range(self.last_line_count):
-                sys.stdout.write('\033[F')
-                sys.stdout.write('\033[K')
+            os.system('clear')
+        self.last_line_count = 0
+        self._prev_lines = None
 
-    def check_for_quit(self):
+    def check_for_quit(self, timeout=0):
+        """Poll for a 'q' keypress, waiting up to timeout seconds"""
+        if not self.interactive:
+            return False
         if os.name == 'nt':
             if msvcrt.kbhit():
                 return msvcrt.getch().decode('utf-8').lower() == 'q'
-        else:
-            rlist, _, _ = select([sys.stdin], [], [], 0)
-            if rlist:
+        elif self._stdin_selector is not None:
+            if self._stdin_selector.select(timeout=timeout):
                 return sys.stdin.read(1).lower() == 'q'
         return False
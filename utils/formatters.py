@@ -1,44 +1,75 @@
-from datetime import datetime
+import time
 
 # Constants
 BYTES_TO_GB = 1024 * 1024 * 1024
 BYTES_TO_MB = 1024 * 1024
+# Reciprocals for the hot display paths: multiplying is cheaper than
+# dividing, and powers of two make the results bit-identical.
+INV_BYTES_TO_GB = 1.0 / BYTES_TO_GB
+INV_BYTES_TO_MB = 1.0 / BYTES_TO_MB
 SEPARATOR_LINE = '-' * 40
 DEFAULT_INTERVAL = 1
 
+NANOSECONDS_PER_SECOND = 1_000_000_000
+
+UNIT_STEP_BITS = 10  # each unit step is 2**10 = 1024
+SPEED_UNITS = ('B/s', 'KB/s', 'MB/s', 'GB/s')
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 # ...existing code from utils.py...
-def format_timestamp(timestamp_str):
-    """Convert ISO timestamp to readable local time"""
-    dt = datetime.fromisoformat(timestamp_str)
-    return dt.strftime('%Y-%m-%d %I:%M:%S %p')
+HOURS_BEFORE_NOON = 12
+
+# Timestamps only resolve to the second, so sub-second ticks reuse the
+# previously formatted string instead of repeating localtime().
+_last_timestamp_second = None
+_last_timestamp_text = None
+
+def format_timestamp(timestamp_ns):
+    """Convert an epoch timestamp in nanoseconds to readable local time
+
+    The layout is fixed, so one localtime() call and an f-string replace
+    datetime allocation plus locale-aware strftime parsing per render, and
+    repeat renders within the same second skip even that.
+    """
+    global _last_timestamp_second, _last_timestamp_text
+    second = timestamp_ns // NANOSECONDS_PER_SECOND
+    if second == _last_timestamp_second:
+        return _last_timestamp_text
+
+    fields = time.localtime(second)
+    hour12 = (fields.tm_hour + 11) % 12 + 1
+    meridiem = 'AM' if fields.tm_hour < HOURS_BEFORE_NOON else 'PM'
+    _last_timestamp_second = second
+    _last_timestamp_text = (
+        f"{fields.tm_year:04d}-{fields.tm_mon:02d}-{fields.tm_mday:02d} "
+        f"{hour12:02d}:{fields.tm_min:02d}:{fields.tm_sec:02d} {meridiem}")
+    return _last_timestamp_text
+
+DEFAULT_NUMBER_SPEC = ',.2f'
 
 def format_number(value, precision=2):
-    """Format number with fixed precision and thousand separators"""
-    formatted = f"{value:.{precision}f}"
-    parts = formatted.split('.')
-    parts[0] = f"{int(parts[0]):,}"
-    return '.'.join(parts)
+    """Format number with fixed precision and thousand separators
 
-def format_speed(bytes_per_sec):
-    """Format speed with appropriate unit and thousand separators"""
-    units = ['B/s', 'KB/s', 'MB/s', 'GB/s']
-    unit_index = 0
-    value = float(bytes_per_sec)
+    The default precision covers every call in the display loop, so it
+    uses a constant spec instead of building one per call.
+    """
+    if precision == 2:
+        return format(value, DEFAULT_NUMBER_SPEC)
+    return format(value, f',.{precision}f')
 
-    while value >= 1024 and unit_index < len(units) - 1:
-        value /= 1024
-        unit_index += 1
+def _scale_to_unit(value, units):
+    """Pick the unit from the integer bit length instead of repeated division"""
+    if value < 1024:
+        return float(value), units[0]
+    unit_index = min((int(value).bit_length() - 1) // UNIT_STEP_BITS, len(units) - 1)
+    return value / (1 << (UNIT_STEP_BITS * unit_index)), units[unit_index]
 
-    return f"{format_number(value)} {units[unit_index]}"
+def format_speed(bytes_per_sec):
+    """Format speed with appropriate unit and thousand separators"""
+    value, unit = _scale_to_unit(bytes_per_sec, SPEED_UNITS)
+    return f"{value:,.2f} {unit}"
 
 def format_bytes(bytes_value):
     """Format bytes with appropriate unit and thousand separators"""
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    unit_index = 0
-    value = float(bytes_value)
-
-    while value >= 1024 and unit_index < len(units) - 1:
-        value /= 1024
-        unit_index += 1
-
-    return f"{format_number(value)} {units[unit_index]}"
+    value, unit = _scale_to_unit(bytes_value, BYTE_UNITS)
+    return f"{value:,.2f} {unit}"
@@ -0,0 +1,52 @@
+from array import array
+
+DEFAULT_CAPACITY = 3600
+
+class SampleHistory:
+    """Bounded column-oriented history of recent scalar samples
+
+    Columns are preallocated array.array ring buffers (struct-of-arrays),
+    so a retained sample costs a few machine words instead of a dict of
+    boxed values and summaries scan contiguous memory.
+    """
+
+    def __init__(self, capacity=DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self.count = 0
+        self._next_index = 0
+        self._timestamps = array('q', [0]) * capacity  # epoch nanoseconds
+        self._cpu_percent = array('d', [0.0]) * capacity
+        self._memory_used = array('d', [0.0]) * capacity
+        self._memory_percent = array('d', [0.0]) * capacity
+
+    def record(self, timestamp_ns, cpu_percent, memory_used, memory_percent):
+        """Store one sample, overwriting the oldest once at capacity"""
+        index = self._next_index
+        self._timestamps[index] = timestamp_ns
+        self._cpu_percent[index] = cpu_percent
+        self._memory_used[index] = memory_used
+        self._memory_percent[index] = memory_percent
+
+        self._next_index = (index + 1) % self.capacity
+        if self.count < self.capacity:
+            self.count += 1
+
+    def summary(self):
+        """Aggregate the retained samples for an end-of-run report"""
+        if not self.count:
+            return None
+
+        cpu = self._retained(self._cpu_percent)
+        memory_percent = self._retained(self._memory_percent)
+        return {
+            'samples': self.count,
+            'cpu_percent_avg': sum(cpu) / self.count,
+            'cpu_percent_max': max(cpu),
+            'memory_percent_max': max(memory_percent)
+        }
+
+    def _retained(self, column):
+        """Return the filled portion of a column; order is irrelevant here"""
+        if self.count < self.capacity:
+            return column[:self.count]
+        return column